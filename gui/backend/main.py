@@ -6,7 +6,9 @@ import logging
 import urllib.request
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -19,6 +21,7 @@ from services.paths import (
     MESH_BIN,
     PREDICT_BIN,
     SOLVER_BIN,
+    RUN_BIN,
     POSTPROCESS_BIN,
     MODELS_DIR,
     WORK_DIR,
@@ -27,10 +30,24 @@ from services.paths import (
     FEEDBACK_DIR,
 )
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Used as the app-wide default so that endpoints returning plain dicts
+    (health, job/pipeline status polls) skip the stdlib encoder.  Routes
+    with a ``response_model`` are still serialised by pydantic directly.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="FiberFoam",
     version=os.environ.get("FIBERFOAM_VERSION", "dev"),
     description="Web GUI for fiber foam flow simulation",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -60,6 +77,19 @@ async def startup():
     """Create required directories and reload persisted jobs."""
     for d in (WORK_DIR, UPLOAD_DIR, JOBS_DIR, FEEDBACK_DIR):
         os.makedirs(d, exist_ok=True)
+    missing = [
+        name
+        for name, path in (
+            ("fiberFoamMesh", MESH_BIN),
+            ("fiberFoamPredict", PREDICT_BIN),
+            ("simpleFoamMod", SOLVER_BIN),
+            ("fiberFoamRun", RUN_BIN),
+            ("fiberFoamPostProcess", POSTPROCESS_BIN),
+        )
+        if path is None
+    ]
+    if missing:
+        logger.warning("Executables not found: %s", ", ".join(missing))
     job_manager.load_persisted_jobs()
 
 
@@ -195,14 +225,14 @@ async def get_job_status(job_id: str, since: int = Query(0, ge=0)):
     log_lines = job_manager.get_log(job_id, since=since)
 
     progress = None
-    if job.get("status") == "completed":
+    if job.status == "completed":
         progress = 1.0
 
     return {
         "jobId": job_id,
-        "status": job.get("status", "not_found"),
+        "status": job.status,
         "progress": progress,
-        "returncode": job.get("returncode"),
+        "returncode": job.returncode,
         "log": log_lines,
     }
 
@@ -32,15 +32,14 @@ def _host_to_container(host_path: str) -> str:
 def _container_to_host(container_path: str) -> str:
     """Convert a container path back to the host-absolute path."""
     norm = os.path.normpath(container_path)
-    root = os.path.normpath(HOST_ROOT)
-    if norm.startswith(root):
-        rel = norm[len(root):]
+    if norm.startswith(HOST_ROOT):
+        rel = norm[len(HOST_ROOT):]
         return rel if rel.startswith("/") else "/" + rel
     return container_path
 
 
 def _is_under_host_root(container_path: str) -> bool:
-    return os.path.normpath(container_path).startswith(os.path.normpath(HOST_ROOT))
+    return os.path.normpath(container_path).startswith(HOST_ROOT)
 
 
 # ---------------------------------------------------------------------------
@@ -219,13 +218,12 @@ async def save_results(req: SaveResultsRequest):
         )
 
     # Delete successfully copied source case dirs from Docker work dir
-    work_norm = os.path.normpath(WORK_DIR)
     deleted = []
     for case_dir in case_dirs:
         dir_name = os.path.basename(case_dir)
         if dir_name not in copied:
             continue
-        if not os.path.normpath(case_dir).startswith(work_norm):
+        if not os.path.normpath(case_dir).startswith(WORK_DIR):
             continue
         try:
             shutil.rmtree(case_dir)
@@ -1,11 +1,137 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from schemas import GeometryUploadResponse
 from services.paths import UPLOAD_DIR, BATCH_DIR
+import asyncio
+import hashlib
 import os
-import shutil
+import sys
+import time
+from collections import OrderedDict
+
+import aiofiles
+
+try:  # optional: native async file I/O (libaio / io_uring) on Linux
+    from aiofile import async_open as _native_async_open
+except ImportError:
+    _native_async_open = None
 
 router = APIRouter()
 
+# Uploads are streamed to disk in fixed-size chunks so large geometries never
+# have to be held in memory and the event loop stays free between chunks.
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Above this size, uploads are written through ``aiofile`` when it is
+# installed, submitting writes to the kernel instead of hopping through the
+# aiofiles thread pool for every chunk.
+_NATIVE_AIO_MIN_SIZE = 32 << 20  # 32 MiB
+
+
+def _open_upload_target(filepath: str, size: int | None):
+    """Return an async binary writer context manager for *filepath*."""
+    if (
+        _native_async_open is not None
+        and sys.platform == "linux"
+        and (size or 0) > _NATIVE_AIO_MIN_SIZE
+    ):
+        return _native_async_open(filepath, "wb")
+    return aiofiles.open(filepath, "wb")
+
+
+# Geometry listings are cached per directory and keyed on the directory's
+# mtime, so any writer adding or removing a file (uploads, preprocessing,
+# batch runs) invalidates the entry.  A listing taken within
+# _LISTING_SETTLE_NS of the last change is not cached, since another change
+# in the same timestamp tick would not move the mtime.
+_LISTING_SETTLE_NS = 1_000_000_000
+_listing_cache: dict[str, tuple[int, list[str]]] = {}
+
+
+def _list_geometry_files(directory: str) -> list[str]:
+    """Return the sorted ``.dat``/``.npy`` file names in *directory*."""
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _listing_cache.get(directory)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(directory) as it:
+        files = sorted(
+            e.name for e in it if e.name.endswith((".dat", ".npy")) and e.is_file()
+        )
+    if time.time_ns() - mtime > _LISTING_SETTLE_NS:
+        _listing_cache[directory] = (mtime, files)
+    return files
+
+
+# Analysis results keyed by (content digest, extension), so re-uploading the
+# same geometry skips the voxel scan.  Bounded LRU.
+_ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: OrderedDict[tuple[str, str], tuple[int, float, list[int]]] = (
+    OrderedDict()
+)
+
+
+# Block size for the bytewise .dat scan; bounds the temporaries to a small
+# multiple of this regardless of file size.
+_DAT_SCAN_BLOCK = 16 << 20  # 16 MiB
+
+
+def _count_dat_tokens(filepath: str) -> tuple[int, int]:
+    """Return ``(tokens, zero_tokens)`` for a whitespace-separated .dat file.
+
+    Works on the raw ASCII bytes rather than parsing numbers: a token is a
+    run of bytes above ``' '`` and a fluid voxel is a token that is exactly
+    ``"0"``.  This matches ``str.split()`` followed by ``== "0"``, but each
+    block is handled in a few vectorised byte comparisons.
+    """
+    import numpy as np
+
+    if os.path.getsize(filepath) == 0:
+        return 0, 0
+    raw = np.memmap(filepath, dtype=np.uint8, mode="r")
+    space = np.array([0x20], dtype=np.uint8)
+    tokens = zeros = 0
+    for start in range(0, raw.size, _DAT_SCAN_BLOCK):
+        stop = min(start + _DAT_SCAN_BLOCK, raw.size)
+        # One byte of context either side, padded with a space at the ends.
+        block = raw[max(start - 1, 0) : stop + 1]
+        if start == 0:
+            block = np.concatenate((space, block))
+        if stop == raw.size:
+            block = np.concatenate((block, space))
+        is_tok = block > 0x20
+        before, after = ~is_tok[:-2], ~is_tok[2:]
+        tokens += int(np.count_nonzero(is_tok[1:-1] & before))
+        zeros += int(np.count_nonzero((block[1:-1] == 0x30) & before & after))
+    return tokens, zeros
+
+
+def _analyse_geometry(filepath: str) -> tuple[int, float, list[int]]:
+    """Return ``(resolution, fluid_fraction, shape)`` for a geometry file.
+
+    Runs synchronously; callers on the event loop should dispatch it to a
+    worker thread.
+    """
+    if filepath.endswith(".npy"):
+        import numpy as np
+
+        # Memory-map so only the pages being counted are resident, and count
+        # the non-zero (solid) voxels directly rather than materialising an
+        # ``arr == 0`` mask the size of the grid.
+        arr = np.load(filepath, mmap_mode="r")
+        shape = list(arr.shape)
+        n = arr.size
+        fluid = (n - int(np.count_nonzero(arr))) / n
+        res = shape[0]
+    else:
+        n, n_fluid = _count_dat_tokens(filepath)
+        if n == 0:
+            raise HTTPException(status_code=400, detail="Geometry file is empty")
+        res = round(n ** (1 / 3))
+        fluid = n_fluid / n
+        nz = n // (res * res) if res > 0 else 0
+        shape = [res, res, nz]
+    return res, fluid, shape
+
 
 @router.post("/upload", response_model=GeometryUploadResponse)
 async def upload_geometry(file: UploadFile = File(...)):
@@ -28,38 +154,37 @@ async def upload_geometry(file: UploadFile = File(...)):
     os.makedirs(UPLOAD_DIR, exist_ok=True)
     filepath = os.path.join(UPLOAD_DIR, file.filename)
 
+    digest = hashlib.blake2b(digest_size=16)
     try:
-        with open(filepath, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        async with _open_upload_target(filepath, file.size) as f:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await f.write(chunk)
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {exc}")
+    finally:
+        await file.close()
 
     # --- Quick analysis -------------------------------------------------------
-    try:
-        if filepath.endswith(".npy"):
-            import numpy as np
-
-            arr = np.load(filepath)
-            shape = list(arr.shape)
-            n = arr.size
-            fluid = int((arr == 0).sum()) / n
-            res = shape[0]
-        else:
-            with open(filepath) as f:
-                values = f.read().split()
-            n = len(values)
-            if n == 0:
-                raise HTTPException(status_code=400, detail="Geometry file is empty")
-            res = round(n ** (1 / 3))
-            fluid = sum(1 for v in values if v == "0") / n
-            nz = n // (res * res) if res > 0 else 0
-            shape = [res, res, nz]
-    except HTTPException:
-        raise
-    except Exception as exc:
-        raise HTTPException(
-            status_code=400, detail=f"Failed to analyse geometry: {exc}"
-        )
+    key = (digest.hexdigest(), os.path.splitext(filepath)[1])
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+        res, fluid, shape = cached
+    else:
+        try:
+            res, fluid, shape = await asyncio.get_running_loop().run_in_executor(
+                None, _analyse_geometry, filepath
+            )
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise HTTPException(
+                status_code=400, detail=f"Failed to analyse geometry: {exc}"
+            )
+        _analysis_cache[key] = (res, fluid, shape)
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
 
     return GeometryUploadResponse(
         filename=file.filename,
@@ -128,10 +253,7 @@ async def list_geometries():
     """Return a list of previously uploaded geometry files."""
     if not os.path.isdir(UPLOAD_DIR):
         return {"files": []}
-    files = sorted(
-        f for f in os.listdir(UPLOAD_DIR) if f.endswith((".dat", ".npy"))
-    )
-    return {"files": files}
+    return {"files": _list_geometry_files(UPLOAD_DIR)}
 
 
 @router.get("/batch-files")
@@ -139,10 +261,7 @@ async def list_batch_files():
     """Return a list of geometry files available in the batch input directory."""
     if not os.path.isdir(BATCH_DIR):
         return {"files": [], "batchDir": BATCH_DIR}
-    files = sorted(
-        f for f in os.listdir(BATCH_DIR) if f.endswith((".dat", ".npy"))
-    )
-    return {"files": files, "batchDir": BATCH_DIR}
+    return {"files": _list_geometry_files(BATCH_DIR), "batchDir": BATCH_DIR}
 
 
 @router.delete("/{filename}")
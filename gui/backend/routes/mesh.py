@@ -1,13 +1,21 @@
 from fastapi import APIRouter, HTTPException, Query
-from schemas import MeshRequest, MeshResponse, JobStatus, JobStatusEnum
+from schemas import MeshRequest, MeshResponse, JobStatus
 from services.executor import job_manager
 from services.config_writer import write_mesh_config
 from services.paths import MESH_BIN, WORK_DIR, UPLOAD_DIR
+import asyncio
 import os
 import re
+import time
 
 router = APIRouter()
 
+# Identical status polls arriving within this window (e.g. several browser
+# tabs watching the same job) share one computed response.
+_STATUS_TTL = 0.1  # seconds
+_STATUS_CACHE_MAX = 256
+_status_cache: dict[tuple[str, int], tuple[float, JobStatus]] = {}
+
 
 @router.post("/generate", response_model=MeshResponse)
 async def generate_mesh(req: MeshRequest):
@@ -33,7 +41,8 @@ async def generate_mesh(req: MeshRequest):
     os.makedirs(case_dir, exist_ok=True)
 
     config_path = os.path.join(case_dir, "fiberfoam_mesh.yaml")
-    write_mesh_config(
+    await asyncio.to_thread(
+        write_mesh_config,
         config_path,
         input_path=req.inputPath,
         voxel_size=req.voxelSize,
@@ -60,22 +69,34 @@ async def generate_mesh(req: MeshRequest):
 @router.get("/status/{job_id}", response_model=JobStatus)
 async def mesh_status(job_id: str, since: int = Query(0, ge=0)):
     """Poll the status and recent log output of a mesh-generation job."""
+    now = time.monotonic()
+    key = (job_id, since)
+    cached = _status_cache.get(key)
+    if cached and now - cached[0] < _STATUS_TTL:
+        return cached[1]
+
     job = job_manager.get_job(job_id)
     log_lines = job_manager.get_log(job_id, since=since)
 
     # Try to extract mesh statistics from log output
     progress = None
-    if job.get("status") == "completed":
+    if job.status == "completed":
         progress = 1.0
 
-    return JobStatus(
+    status = JobStatus.model_construct(
         jobId=job_id,
-        status=JobStatusEnum(job["status"]),
+        status=job.status,
         progress=progress,
-        returncode=job.get("returncode"),
+        returncode=job.returncode,
         log=log_lines,
     )
 
+    if len(_status_cache) >= _STATUS_CACHE_MAX:
+        for k in [k for k, (t, _) in _status_cache.items() if now - t >= _STATUS_TTL]:
+            del _status_cache[k]
+    _status_cache[key] = (now, status)
+    return status
+
 
 @router.post("/cancel/{job_id}")
 async def cancel_mesh(job_id: str):
@@ -88,6 +109,11 @@ async def cancel_mesh(job_id: str):
     return {"jobId": job_id, "status": "cancelled"}
 
 
+_RE_MESH_STAT = re.compile(
+    r"(?P<key>nCells|nPoints|nFaces|nInternalFaces)[ \t]*[:=][ \t]*(?P<val>\d+)"
+)
+
+
 def _parse_mesh_stats(log_lines: list[str]) -> dict:
     """Extract nCells / nPoints / nFaces / nInternalFaces from log output.
 
@@ -96,15 +122,6 @@ def _parse_mesh_stats(log_lines: list[str]) -> dict:
         nPoints: 234567
     """
     stats: dict[str, int] = {}
-    patterns = {
-        "nCells": re.compile(r"nCells\s*[:=]\s*(\d+)"),
-        "nPoints": re.compile(r"nPoints\s*[:=]\s*(\d+)"),
-        "nFaces": re.compile(r"nFaces\s*[:=]\s*(\d+)"),
-        "nInternalFaces": re.compile(r"nInternalFaces\s*[:=]\s*(\d+)"),
-    }
-    for line in log_lines:
-        for key, pat in patterns.items():
-            m = pat.search(line)
-            if m:
-                stats[key] = int(m.group(1))
+    for m in _RE_MESH_STAT.finditer("\n".join(log_lines)):
+        stats[m["key"]] = int(m["val"])
     return stats
@@ -163,7 +163,7 @@ async def stop_solver(pipeline_id: str):
     cfg = state.get("config", {})
     if cfg.get("outputDir"):
         candidate = os.path.normpath(os.path.join(OUTPUT_ROOT, cfg["outputDir"]))
-        if candidate.startswith(os.path.normpath(OUTPUT_ROOT)):
+        if candidate.startswith(OUTPUT_ROOT):
             base_dir = candidate
 
     case_dir = os.path.join(base_dir, f"{case_name}_{direction}")
@@ -195,7 +195,7 @@ async def stop_solver(pipeline_id: str):
     job_id = sim_step.get("jobId")
     if job_id:
         job = job_manager.get_job(job_id)
-        proc = job.get("process")
+        proc = job.process
         if proc and proc.returncode is None:
             import signal
             try:
@@ -370,7 +370,7 @@ async def _execute_pipeline(
     if req.outputDir:
         candidate = os.path.normpath(os.path.join(OUTPUT_ROOT, req.outputDir))
         # Guard against path traversal outside the browsable root
-        if candidate.startswith(os.path.normpath(OUTPUT_ROOT)):
+        if candidate.startswith(OUTPUT_ROOT):
             base_dir = candidate
 
     try:
@@ -473,7 +473,8 @@ async def _run_mesh_step(
         return False
 
     config_path = os.path.join(case_dir, "fiberfoam_mesh.yaml")
-    write_mesh_config(
+    await asyncio.to_thread(
+        write_mesh_config,
         config_path,
         input_path=req.inputPath,
         voxel_size=req.voxelSize,
@@ -507,7 +508,8 @@ async def _run_predict_step(
         return await _run_quick_predict_step(direction, req, case_dir, step_info)
 
     config_path = os.path.join(case_dir, "fiberfoam_predict.yaml")
-    write_prediction_config(
+    await asyncio.to_thread(
+        write_prediction_config,
         config_path,
         input_path=req.inputPath,
         voxel_size=req.voxelSize,
@@ -604,7 +606,8 @@ async def _run_simulate_step(
     cmd = ["bash", "-c", solver_cmd]
 
     config_path = os.path.join(case_dir, "fiberfoam_sim.yaml")
-    write_simulation_config(
+    await asyncio.to_thread(
+        write_simulation_config,
         config_path,
         case_dir=foam_case_dir,
         solver=req.solver,
@@ -612,7 +615,10 @@ async def _run_simulate_step(
         write_interval=req.writeInterval,
     )
 
-    return await _run_and_wait(cmd, foam_case_dir, step_info, "simulate")
+    return await _run_and_wait(
+        cmd, foam_case_dir, step_info, "simulate",
+        log_path=os.path.join(foam_case_dir, "log.solver"),
+    )
 
 
 def _patch_controlDict(
@@ -697,23 +703,36 @@ def _patch_fvSolution(
 
 
 async def _run_and_wait(
-    cmd: list[str], cwd: str, step_info: dict, job_type: str
+    cmd: list[str],
+    cwd: str,
+    step_info: dict,
+    job_type: str,
+    log_path: str | None = None,
 ) -> bool:
     """Run a command via job_manager and wait for it to complete."""
-    job_id = await job_manager.run_command(cmd, cwd=cwd, job_type=job_type)
+    on_output = None
+    if job_type == "simulate":
+        # Parse residuals as output arrives so no iteration is lost once
+        # it leaves the job's log ring buffer, whether or not anyone polls.
+        parser = step_info["_residualParser"] = _ResidualParser()
+        on_output = parser.feed
+    job_id = await job_manager.run_command(
+        cmd, cwd=cwd, job_type=job_type, log_path=log_path,
+        on_output=on_output,
+    )
     step_info["jobId"] = job_id
 
     # Poll until the job finishes
     while True:
         job = job_manager.get_job(job_id)
-        status = job.get("status", "not_found")
+        status = job.status
         if status in ("completed", "failed", "not_found"):
-            full_log = job_manager.get_log(job_id)
-            # For simulate jobs, parse residuals from the full log before
-            # truncating so the convergence chart survives after completion.
+            # Keep the parsed residuals once the log is truncated so the
+            # convergence chart survives after completion.
             if job_type == "simulate":
-                step_info["_residuals"] = _parse_residuals(full_log)
-            step_info["log"] = full_log[-50:]
+                step_info["_residuals"] = _live_residuals(step_info)
+                step_info.pop("_residualParser", None)
+            step_info["log"] = job_manager.get_log_tail(job_id, 50)
             return status == "completed"
         await asyncio.sleep(1.0)
 
@@ -920,45 +939,66 @@ _RE_PERM_ERROR = re.compile(
 )
 
 
-def _parse_residuals(log_lines: list[str]) -> list[dict]:
-    """Extract per-iteration residuals, permeability and convergence info from solver log."""
-    residuals: list[dict] = []
-    current_iter: int | None = None
-    current: dict = {}
-
-    for line in log_lines:
-        m = _RE_TIME.search(line)
-        if m:
-            if current_iter is not None and current:
-                residuals.append({"iteration": current_iter, **current})
-            current_iter = int(m.group(1))
-            current = {}
-            continue
-
-        m = _RE_RESIDUAL.search(line)
-        if m:
-            current[m.group(1)] = float(m.group(2))
+class _ResidualParser:
+    """Incremental solver-log parser for per-iteration residuals.
 
-        m = _RE_PERM_MAIN.search(line)
-        if m:
-            current["permVolAvg"] = float(m.group(1))
+    ``feed`` may be called repeatedly with successive chunks of the log.
+    """
 
-        m = _RE_SLOPE.search(line)
-        if m:
-            current["slope"] = float(m.group(1))
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+        self.current_iter: int | None = None
+        self.current: dict = {}
+
+    def feed(self, log_lines) -> None:
+        current = self.current
+        for line in log_lines:
+            m = _RE_TIME.search(line)
+            if m:
+                if self.current_iter is not None and current:
+                    self.rows.append({"iteration": self.current_iter, **current})
+                self.current_iter = int(m.group(1))
+                current = self.current = {}
+                continue
+
+            m = _RE_RESIDUAL.search(line)
+            if m:
+                current[m.group(1)] = float(m.group(2))
+
+            m = _RE_PERM_MAIN.search(line)
+            if m:
+                current["permVolAvg"] = float(m.group(1))
+
+            m = _RE_SLOPE.search(line)
+            if m:
+                current["slope"] = float(m.group(1))
+
+            m = _RE_PRED_PERM.search(line)
+            if m:
+                current["predPerm"] = float(m.group(1))
+
+            m = _RE_PERM_ERROR.search(line)
+            if m:
+                current["permError"] = float(m.group(1))
+
+    def result(self) -> list[dict]:
+        """Return the parsed rows, including the iteration still in progress."""
+        if self.current_iter is not None and self.current:
+            return self.rows + [{"iteration": self.current_iter, **self.current}]
+        return list(self.rows)
 
-        m = _RE_PRED_PERM.search(line)
-        if m:
-            current["predPerm"] = float(m.group(1))
 
-        m = _RE_PERM_ERROR.search(line)
-        if m:
-            current["permError"] = float(m.group(1))
+def _parse_residuals(log_lines: list[str]) -> list[dict]:
+    """Extract per-iteration residuals, permeability and convergence info from solver log."""
+    parser = _ResidualParser()
+    parser.feed(log_lines)
+    return parser.result()
 
-    if current_iter is not None and current:
-        residuals.append({"iteration": current_iter, **current})
 
-    return residuals
+def _live_residuals(step_info: dict) -> list[dict]:
+    """Return the residuals parsed so far for a running simulate step."""
+    parser = step_info.get("_residualParser")
+    return parser.result() if parser is not None else []
 
 
 def _parse_permeability_csv(case_dir: str, direction: str) -> dict | None:
@@ -999,17 +1039,17 @@ def _to_pipeline_status(state: dict) -> dict:
     enriched_steps = []
     for s in state["steps"]:
         step = dict(s)
+        step.pop("_residualParser", None)
         # Enrich running steps with live data from the job manager
         if step["status"] == "running" and step.get("jobId"):
             job = job_manager.get_job(step["jobId"])
-            live_log = job_manager.get_log(step["jobId"])
-            step["log"] = live_log[-100:]  # last 100 lines
+            step["log"] = job_manager.get_log_tail(step["jobId"], 100)
             # Estimate progress from log line count (rough heuristic)
-            if job.get("status") == "completed":
+            if job.status == "completed":
                 step["progress"] = 100.0
             # Parse residuals for simulate steps
             if step.get("name", "").startswith("simulate"):
-                step["residuals"] = _parse_residuals(live_log)
+                step["residuals"] = _live_residuals(s)
         elif step.get("name", "").startswith("simulate"):
             # Use cached residuals (parsed from full log before truncation)
             # so the convergence chart persists after the solver finishes.
@@ -1,14 +1,16 @@
-import json
+import asyncio
 import os
 import re
 
+import aiofiles
+import orjson
 from fastapi import APIRouter, HTTPException, Query
+from pydantic import TypeAdapter
 from schemas import (
     PostProcessRequest,
     PostProcessResponse,
     PermeabilityData,
     JobStatus,
-    JobStatusEnum,
 )
 from services.executor import job_manager
 from services.config_writer import write_postprocess_config
@@ -31,7 +33,8 @@ async def run_postprocess(req: PostProcessRequest):
         )
 
     config_path = os.path.join(req.caseDir, "fiberfoam_post.yaml")
-    write_postprocess_config(
+    await asyncio.to_thread(
+        write_postprocess_config,
         config_path,
         case_dir=req.caseDir,
         method=req.method.value,
@@ -57,13 +60,13 @@ async def postprocess_status(job_id: str, since: int = Query(0, ge=0)):
     job = job_manager.get_job(job_id)
     log_lines = job_manager.get_log(job_id, since=since)
 
-    progress = 1.0 if job.get("status") == "completed" else None
+    progress = 1.0 if job.status == "completed" else None
 
-    return JobStatus(
+    return JobStatus.model_construct(
         jobId=job_id,
-        status=JobStatusEnum(job["status"]),
+        status=job.status,
         progress=progress,
-        returncode=job.get("returncode"),
+        returncode=job.returncode,
         log=log_lines,
     )
 
@@ -76,24 +79,24 @@ async def postprocess_results(job_id: str):
     If the executable also writes a JSON results file we read that instead.
     """
     job = job_manager.get_job(job_id)
-    if job.get("status") == "not_found":
+    if job.status == "not_found":
         raise HTTPException(status_code=404, detail="Job not found")
-    if job.get("status") == "running":
+    if job.status == "running":
         raise HTTPException(
             status_code=409, detail="Job is still running; results not yet available"
         )
-    if job.get("status") == "failed":
+    if job.status == "failed":
         raise HTTPException(
             status_code=500,
             detail="Post-processing failed. Check /status endpoint for logs.",
         )
 
-    log_lines = job.get("log", [])
+    log_lines = job.log
 
     # First try: look for a JSON results file written by the executable
     # (convention: <caseDir>/permeability_results.json)
     case_dir = _extract_case_dir(log_lines)
-    results = _try_load_json_results(case_dir)
+    results = await _try_load_json_results(case_dir)
     if results is not None:
         return PostProcessResponse(
             jobId=job_id, caseDir=case_dir or "", results=results
@@ -122,17 +125,25 @@ async def cancel_postprocess(job_id: str):
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-# Regex patterns matching typical C++ log output from PermeabilityCalculator.
-_RE_DIRECTION = re.compile(r"Direction\s*[:=]\s*(\w)")
-_RE_PERM_VOL = re.compile(
-    r"[Pp]ermeability\s*\(vol(?:ume)?[\s-]*avg\w*\)\s*[:=]\s*([\d.eE+-]+)"
+# Regex matching typical C++ log output from PermeabilityCalculator.  Each
+# alternative captures into a group named after the PermeabilityData field
+# it fills, so a single scan over the log dispatches on ``m.lastgroup``.
+_RE_RESULT_FIELD = re.compile(
+    r"Direction[ \t]*[:=][ \t]*(?P<direction>\w)"
+    r"|[Pp]ermeability[ \t]*\(vol(?:ume)?[ \t-]*avg\w*\)[ \t]*[:=][ \t]*"
+    r"(?P<permVolAvgMain>[\d.eE+-]+)"
+    r"|[Pp]ermeability[ \t]*\(flow[ \t-]*rate\)[ \t]*[:=][ \t]*"
+    r"(?P<permFlowRate>[\d.eE+-]+)"
+    r"|[Ff]iber[ \t]*[Vv]olume[ \t]*[Cc]ontent[ \t]*[:=][ \t]*"
+    r"(?P<fiberVolumeContent>[\d.eE+-]+)"
+    r"|[Ff]low[ \t]*[Ll]ength[ \t]*[:=][ \t]*(?P<flowLength>[\d.eE+-]+)"
+    r"|[Cc]ross[ \t-]*[Ss]ection[ \t]*[Aa]rea[ \t]*[:=][ \t]*"
+    r"(?P<crossSectionArea>[\d.eE+-]+)"
 )
-_RE_PERM_FLOW = re.compile(
-    r"[Pp]ermeability\s*\(flow[\s-]*rate\)\s*[:=]\s*([\d.eE+-]+)"
-)
-_RE_FVC = re.compile(r"[Ff]iber\s*[Vv]olume\s*[Cc]ontent\s*[:=]\s*([\d.eE+-]+)")
-_RE_FLOW_LEN = re.compile(r"[Ff]low\s*[Ll]ength\s*[:=]\s*([\d.eE+-]+)")
-_RE_CROSS_AREA = re.compile(r"[Cc]ross[\s-]*[Ss]ection\s*[Aa]rea\s*[:=]\s*([\d.eE+-]+)")
+# Substrings at least one of which occurs in every line _RE_RESULT_FIELD can
+# match.  Most solver output contains none of them, so checking these first
+# keeps the bulk of the log away from the regex engine.
+_RESULT_KEYWORDS = ("irection", "ermeability", "iber", "low", "ross")
 
 
 def _parse_results_from_log(log_lines: list[str]) -> list[PermeabilityData]:
@@ -142,34 +153,20 @@ def _parse_results_from_log(log_lines: list[str]) -> list[PermeabilityData]:
 
     def _flush():
         if current.get("direction"):
-            results.append(PermeabilityData(**current))
+            # Fields come straight from the regex groups above (a direction
+            # letter and floats), so skip pydantic validation.
+            results.append(PermeabilityData.model_construct(**current))
 
-    for line in log_lines:
-        m = _RE_DIRECTION.search(line)
-        if m:
+    candidates = "\n".join(
+        line for line in log_lines if any(k in line for k in _RESULT_KEYWORDS)
+    )
+    for m in _RE_RESULT_FIELD.finditer(candidates):
+        field = m.lastgroup
+        if field == "direction":
             _flush()
-            current = {"direction": m.group(1).lower()}
-            continue
-
-        m = _RE_PERM_VOL.search(line)
-        if m:
-            current["permVolAvgMain"] = float(m.group(1))
-
-        m = _RE_PERM_FLOW.search(line)
-        if m:
-            current["permFlowRate"] = float(m.group(1))
-
-        m = _RE_FVC.search(line)
-        if m:
-            current["fiberVolumeContent"] = float(m.group(1))
-
-        m = _RE_FLOW_LEN.search(line)
-        if m:
-            current["flowLength"] = float(m.group(1))
-
-        m = _RE_CROSS_AREA.search(line)
-        if m:
-            current["crossSectionArea"] = float(m.group(1))
+            current = {"direction": m["direction"].lower()}
+        else:
+            current[field] = float(m[field])
 
     _flush()
     return results
@@ -185,7 +182,10 @@ def _extract_case_dir(log_lines: list[str]) -> str:
     return ""
 
 
-def _try_load_json_results(case_dir: str | None) -> list[PermeabilityData] | None:
+_PERMEABILITY_LIST = TypeAdapter(list[PermeabilityData])
+
+
+async def _try_load_json_results(case_dir: str | None) -> list[PermeabilityData] | None:
     """Load structured results from JSON if the executable wrote one."""
     if not case_dir:
         return None
@@ -193,12 +193,12 @@ def _try_load_json_results(case_dir: str | None) -> list[PermeabilityData] | Non
     if not os.path.isfile(json_path):
         return None
     try:
-        with open(json_path) as f:
-            data = json.load(f)
+        async with aiofiles.open(json_path, "rb") as f:
+            data = orjson.loads(await f.read())
         if isinstance(data, list):
-            return [PermeabilityData(**entry) for entry in data]
+            return _PERMEABILITY_LIST.validate_python(data)
         if isinstance(data, dict) and "results" in data:
-            return [PermeabilityData(**entry) for entry in data["results"]]
+            return _PERMEABILITY_LIST.validate_python(data["results"])
     except Exception:
         return None
     return None
@@ -8,11 +8,11 @@ from schemas import (
     QuickPredictionResponse,
     QuickPredictionData,
     JobStatus,
-    JobStatusEnum,
 )
 from services.executor import job_manager
 from services.config_writer import write_prediction_config
 from services.paths import PREDICT_BIN, WORK_DIR, MODELS_DIR, UPLOAD_DIR
+import asyncio
 import os
 
 router = APIRouter()
@@ -43,7 +43,8 @@ async def run_prediction(req: PredictionRequest):
     models_dir = req.modelsDir if req.modelsDir else MODELS_DIR
 
     config_path = os.path.join(output_dir, "fiberfoam_predict.yaml")
-    write_prediction_config(
+    await asyncio.to_thread(
+        write_prediction_config,
         config_path,
         input_path=req.inputPath,
         voxel_resolution=req.voxelRes,
@@ -85,9 +86,9 @@ async def prediction_status(job_id: str, since: int = Query(0, ge=0)):
     log_lines = job_manager.get_log(job_id, since=since)
 
     progress = None
-    if job.get("status") == "completed":
+    if job.status == "completed":
         progress = 1.0
-    elif job.get("status") == "running":
+    elif job.status == "running":
         # Attempt to estimate progress from log lines
         for line in reversed(log_lines):
             if "%" in line:
@@ -98,11 +99,11 @@ async def prediction_status(job_id: str, since: int = Query(0, ge=0)):
                     pass
                 break
 
-    return JobStatus(
+    return JobStatus.model_construct(
         jobId=job_id,
-        status=JobStatusEnum(job["status"]),
+        status=job.status,
         progress=progress,
-        returncode=job.get("returncode"),
+        returncode=job.returncode,
         log=log_lines,
     )
 
@@ -216,7 +217,7 @@ async def export_prediction_vtk(pipeline_id: str, body: VtkExportBody = VtkExpor
     # Determine output directory
     if body.destPath:
         vtk_dir = os.path.normpath(os.path.join(OUTPUT_ROOT, body.destPath))
-        if not vtk_dir.startswith(os.path.normpath(OUTPUT_ROOT)):
+        if not vtk_dir.startswith(OUTPUT_ROOT):
             raise HTTPException(status_code=400, detail="Invalid destination path")
     else:
         vtk_dir = os.path.join(predict_dir, "VTK")
@@ -1,11 +1,11 @@
 import asyncio
-import json
 import os
 import re
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 from schemas import SimulationRequest, SimulationResponse, JobStatus, JobStatusEnum
-from services.executor import job_manager
+from services.executor import Job, job_manager
 from services.config_writer import write_simulation_config
 from services.paths import RUN_BIN, SOLVER_BIN, OPENFOAM_BASHRC
 
@@ -26,7 +26,8 @@ async def run_simulation(req: SimulationRequest):
         )
 
     config_path = os.path.join(req.caseDir, "fiberfoam_sim.yaml")
-    write_simulation_config(
+    await asyncio.to_thread(
+        write_simulation_config,
         config_path,
         case_dir=req.caseDir,
         solver=req.solver,
@@ -49,7 +50,9 @@ async def run_simulation(req: SimulationRequest):
         )
 
     log_path = os.path.join(req.caseDir, "log.solver")
-    job_id = await job_manager.run_command(cmd, cwd=req.caseDir, job_type="simulate")
+    job_id = await job_manager.run_command(
+        cmd, cwd=req.caseDir, job_type="simulate", log_path=log_path
+    )
 
     return SimulationResponse(
         jobId=job_id,
@@ -70,11 +73,11 @@ async def simulation_status(job_id: str, since: int = Query(0, ge=0)):
 
     progress = _estimate_progress(job, log_lines)
 
-    return JobStatus(
+    return JobStatus.model_construct(
         jobId=job_id,
-        status=JobStatusEnum(job["status"]),
+        status=job.status,
         progress=progress,
-        returncode=job.get("returncode"),
+        returncode=job.returncode,
         log=log_lines,
     )
 
@@ -95,26 +98,31 @@ async def simulation_log_ws(websocket: WebSocket, job_id: str):
     try:
         while True:
             job = job_manager.get_job(job_id)
+            # Fetch the event before reading so nothing appended after the
+            # read can be missed.
+            updated = job_manager.get_update_event(job_id)
             new_lines = job_manager.get_log(job_id, since=cursor)
             if new_lines:
                 cursor += len(new_lines)
                 await websocket.send_text(
-                    json.dumps({"lines": new_lines, "status": job["status"]})
+                    orjson.dumps(
+                        {"lines": new_lines, "status": job.status.value}
+                    ).decode()
                 )
-            if job["status"] in ("completed", "failed", "not_found"):
+            if job.status in ("completed", "failed", "not_found"):
                 # Send final status and close
                 await websocket.send_text(
-                    json.dumps(
+                    orjson.dumps(
                         {
                             "lines": [],
-                            "status": job["status"],
-                            "returncode": job.get("returncode"),
+                            "status": job.status.value,
+                            "returncode": job.returncode,
                         }
-                    )
+                    ).decode()
                 )
                 await websocket.close()
                 break
-            await asyncio.sleep(0.5)
+            await updated.wait()
     except WebSocketDisconnect:
         pass  # Client disconnected, nothing to clean up
 
@@ -137,22 +145,23 @@ async def cancel_simulation(job_id: str):
 _RE_TIME = re.compile(r"^Time\s*=\s*([\d.eE+-]+)")
 
 
-def _estimate_progress(job: dict, recent_lines: list[str]) -> float | None:
+def _estimate_progress(job: Job, recent_lines: list[str]) -> float | None:
     """Try to estimate solver progress from log output.
 
     OpenFOAM solvers print ``Time = <value>`` lines.  If we can find the
     current time and the max iterations from the job config we can compute
     a rough fraction.
     """
-    if job.get("status") == "completed":
+    if job.status == "completed":
         return 1.0
-    if job.get("status") != "running":
+    if job.status != "running":
         return None
 
-    # Walk the full log backwards to find latest Time
-    all_lines = job.get("log", [])
+    # Walk the newly arrived lines backwards to find latest Time
     current_time = None
-    for line in reversed(all_lines):
+    for line in reversed(recent_lines):
+        if not line.startswith("Time"):
+            continue
         m = _RE_TIME.match(line)
         if m:
             try:
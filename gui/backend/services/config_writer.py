@@ -1,9 +1,48 @@
-"""Utility for writing YAML config files consumed by the C++ executables."""
+"""Utility for writing YAML config files consumed by the C++ executables.
 
+The configs are written as indented JSON.  JSON is a subset of YAML 1.2 and
+``YAML::LoadFile`` (yaml-cpp) reads it as-is, so the ``.yaml`` files stay
+valid for the C++ side while avoiding a YAML emitter here.
+"""
+
+import hashlib
+import json
 import os
-import yaml
 from typing import Optional
 
+# output_path -> (sha1 of the text last written there, file mtime after the
+# write).  Re-running a job with the same settings then skips the write.
+_write_cache: dict[str, tuple[str, int]] = {}
+# Directories already created by _write_cfg in this process.
+_made_dirs: set[str] = set()
+
+
+def _write_cfg(output_path: str, cfg: dict) -> str:
+    """Write *cfg* to *output_path* unless identical content is already there."""
+    text = json.dumps(cfg, indent=2)
+    digest = hashlib.sha1(text.encode()).hexdigest()
+    cached = _write_cache.get(output_path)
+    if cached is not None and cached[0] == digest:
+        try:
+            if os.stat(output_path).st_mtime_ns == cached[1]:
+                return output_path
+        except OSError:
+            pass
+    directory = os.path.dirname(output_path)
+    if directory not in _made_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _made_dirs.add(directory)
+    try:
+        f = open(output_path, "w")
+    except FileNotFoundError:
+        # Directory was removed since we created it (e.g. case deleted)
+        os.makedirs(directory, exist_ok=True)
+        f = open(output_path, "w")
+    with f:
+        f.write(text)
+    _write_cache[output_path] = (digest, os.stat(output_path).st_mtime_ns)
+    return output_path
+
 
 def write_mesh_config(
     output_path: str,
@@ -39,10 +78,7 @@ def write_mesh_config(
             "path": os.path.dirname(output_path),
         },
     }
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
-    return output_path
+    return _write_cfg(output_path, cfg)
 
 
 def write_prediction_config(
@@ -86,10 +122,7 @@ def write_prediction_config(
             "path": os.path.dirname(output_path),
         },
     }
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
-    return output_path
+    return _write_cfg(output_path, cfg)
 
 
 def write_simulation_config(
@@ -117,10 +150,7 @@ def write_simulation_config(
             "path": case_dir,
         },
     }
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
-    return output_path
+    return _write_cfg(output_path, cfg)
 
 
 def write_postprocess_config(
@@ -140,7 +170,4 @@ def write_postprocess_config(
             "path": case_dir,
         },
     }
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        yaml.dump(cfg, f, default_flow_style=False)
-    return output_path
+    return _write_cfg(output_path, cfg)
@@ -1,15 +1,227 @@
 import asyncio
-import uuid
-from typing import Optional
+import codecs
+import collections
+import fcntl
+import itertools
+import logging
+import os
+import secrets
+import signal
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Optional
 
+from schemas import JobStatusEnum
 from services import job_store
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of log lines kept in memory per job.  Older lines are
+# dropped from the front; ``log_start`` counts them so that the ``since``
+# cursor handed out to clients stays an absolute line index.  Jobs started
+# with a ``log_path`` also write their raw output there, which remains the
+# complete record once lines have left the ring.
+LOG_MAX_LINES = 50_000
+
+# Write buffer for the on-disk log copy.
+LOG_FILE_BUFFER = 1 << 16
+
+# Subprocess output is read in chunks of this size and split into lines.
+READ_CHUNK_SIZE = 1 << 16
+
+# StreamReader buffer limit and requested kernel pipe size for job stdout,
+# so bursty solver output does not stall on a full 64 KiB pipe.
+STREAM_LIMIT = 1 << 20
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Seconds a cancelled job gets to exit after SIGTERM before it is killed.
+CANCEL_GRACE_PERIOD = 5.0
+
+# Jobs kept in memory.  Beyond this the least recently used finished jobs
+# are dropped; their persisted record stays in ``JOBS_DIR``.
+MAX_JOBS = 256
+
+
+def _new_log(lines=()) -> collections.deque:
+    return collections.deque(lines, maxlen=LOG_MAX_LINES)
+
+
+@dataclass(slots=True)
+class Job:
+    """Bookkeeping for one subprocess job.
+
+    ``status`` is always a :class:`JobStatusEnum` member so handlers can
+    pass it through without re-coercing.  ``log`` holds the most recent
+    ``LOG_MAX_LINES`` lines; ``log_start`` is the absolute index of its
+    first line.  ``partial`` is output received after the last newline.
+    """
+
+    status: JobStatusEnum
+    cmd: list = field(default_factory=list)
+    type: str = "unknown"
+    log: collections.deque = field(default_factory=_new_log)
+    log_start: int = 0
+    partial: str = ""
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+    process: Optional[asyncio.subprocess.Process] = None
+    returncode: Optional[int] = None
+    log_path: Optional[str] = None
+    log_file: Optional[BinaryIO] = None
+    reader_task: Optional[asyncio.Task] = None
+    on_output: Optional[Callable[[list[str]], None]] = None
+
+
+def _notify(job: Job) -> None:
+    """Wake everyone waiting on the job's current update event.
+
+    The event is swapped for a fresh one before being set, so each waiter
+    sees exactly the changes that happened after it fetched the event.
+    """
+    event = job.updated
+    job.updated = asyncio.Event()
+    event.set()
+
+
+def _close_log_file(job: Job) -> None:
+    log_file = job.log_file
+    if log_file is not None:
+        job.log_file = None
+        try:
+            log_file.close()
+        except OSError as exc:
+            _drop_log_file(job, exc)
+
+
+def _drop_log_file(job: Job, exc: OSError) -> None:
+    """Stop writing the job's log file after *exc*; the ring keeps capturing."""
+    logger.warning("Cannot write job log %s: %s", job.log_path, exc)
+    log_file = job.log_file
+    job.log_file = None
+    job.log_path = None
+    if log_file is not None:
+        try:
+            log_file.close()
+        except OSError:
+            pass
+
+
+def _write_log_file(job: Job, data: bytes) -> None:
+    """Write *data* to the job's log file, dropping the file on error."""
+    if job.log_file is None:
+        return
+    try:
+        job.log_file.write(data)
+    except OSError as exc:
+        _drop_log_file(job, exc)
+
+
+def _extend_log(job: Job, lines: list[str]) -> None:
+    """Append *lines* to the job log and wake waiters once for the batch.
+
+    ``log_start`` advances by the number of lines pushed out of the ring.
+    """
+    log = job.log
+    overflow = len(log) + len(lines) - log.maxlen
+    if overflow > 0:
+        job.log_start += overflow
+    log.extend(lines)
+    if job.on_output is not None:
+        try:
+            job.on_output(lines)
+        except Exception:
+            logger.exception("Output callback failed; detaching it")
+            job.on_output = None
+    _notify(job)
+
+
+def _append_log(job: Job, line: str) -> None:
+    """Append a single *line* to the job log."""
+    _extend_log(job, [line])
+
+
+def _append_note(job: Job, line: str) -> None:
+    """Append a line that did not come from the process, e.g. a cancel marker.
+
+    It is written to the log file as well so that file line numbers keep
+    matching the absolute log indices.  A pending partial output line is
+    terminated first, in the file and in memory alike.
+    """
+    if job.partial:
+        _write_log_file(job, b"\n")
+        _append_log(job, job.partial.rstrip())
+        job.partial = ""
+    _write_log_file(job, line.encode() + b"\n")
+    _append_log(job, line)
+
+
+def _log_tail(log: collections.deque, n: int) -> list[str]:
+    """Return the last *n* lines of *log* as a list."""
+    return list(itertools.islice(log, max(0, len(log) - n), None))
+
+
+def _enlarge_stdout_pipe(process: asyncio.subprocess.Process) -> None:
+    """Best-effort increase of the kernel buffer behind *process.stdout*."""
+    set_size = getattr(fcntl, "F_SETPIPE_SZ", None)  # Linux only
+    if set_size is None:
+        return
+    try:
+        pipe = process._transport.get_pipe_transport(1).get_extra_info("pipe")
+        fcntl.fcntl(pipe.fileno(), set_size, PIPE_BUFFER_SIZE)
+    except (AttributeError, OSError):
+        # Private transport API changed, or the size exceeds
+        # /proc/sys/fs/pipe-max-size for an unprivileged process.
+        pass
+
+
+async def _kill_after(proc: asyncio.subprocess.Process, delay: float) -> None:
+    """SIGKILL *proc*'s process group unless it exits within *delay* seconds."""
+    try:
+        await asyncio.wait_for(proc.wait(), delay)
+        return
+    except asyncio.TimeoutError:
+        pass
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+def _job_from_record(stored: dict) -> Job:
+    """Build a finished :class:`Job` from its persisted JSON record."""
+    status = stored.get("status", "unknown")
+    if status == "running":
+        status = "failed"  # cannot resume
+    try:
+        status = JobStatusEnum(status)
+    except ValueError:
+        status = JobStatusEnum.failed
+    return Job(
+        status=status,
+        cmd=stored.get("cmd", []),
+        type=stored.get("type", "unknown"),
+        log=_new_log(stored.get("log", [])),
+        returncode=stored.get("returncode"),
+    )
+
 
 class JobManager:
-    """Manages long-running subprocess jobs (C++ executables) with log capture."""
+    """Manages long-running subprocess jobs (C++ executables) with log capture.
+
+    All job state is only touched from the event loop thread, and none of
+    the methods that read or mutate a job await in between, so each call
+    sees a consistent job (e.g. ``log`` and ``log_start`` always agree)
+    without locking.  Keep it that way: anything run through
+    ``asyncio.to_thread`` must not touch ``self.jobs``.
+    """
 
     def __init__(self):
-        self.jobs: dict[str, dict] = {}
+        self.jobs: collections.OrderedDict[str, Job] = collections.OrderedDict()
+        # The event loop only keeps weak references to tasks, so the
+        # per-job output readers are held here until they finish.
+        self._reader_tasks: set[asyncio.Task] = set()
+        self._kill_tasks: set[asyncio.Task] = set()
 
     async def run_command(
         self,
@@ -17,20 +229,36 @@ class JobManager:
         cwd: Optional[str] = None,
         env: Optional[dict] = None,
         job_type: str = "unknown",
+        log_path: Optional[str] = None,
+        on_output: Optional[Callable[[list[str]], None]] = None,
     ) -> str:
         """Launch *cmd* as an async subprocess and return a job-ID for tracking.
 
-        Output is captured line-by-line and stored in ``self.jobs[job_id]["log"]``.
+        Output is split into lines and stored in ``self.jobs[job_id].log``,
+        a ring buffer holding the most recent ``LOG_MAX_LINES`` lines.  If
+        *log_path* is given, the complete raw output is also written there.
+        *on_output*, if given, is called with every batch of new lines as
+        they are appended, so callers can consume the whole output even
+        after it has left the ring.
         """
-        job_id = str(uuid.uuid4())[:8]
-        self.jobs[job_id] = {
-            "status": "running",
-            "cmd": cmd,
-            "log": [],
-            "process": None,
-            "returncode": None,
-            "type": job_type,
-        }
+        job_id = self._new_job_id()
+        log_file = None
+        if log_path is not None:
+            try:
+                log_file = open(log_path, "wb", buffering=LOG_FILE_BUFFER)
+            except OSError as exc:
+                logger.warning("Cannot open job log %s: %s", log_path, exc)
+                log_path = None
+        job = Job(
+            status=JobStatusEnum.running,
+            cmd=cmd,
+            type=job_type,
+            log_path=log_path,
+            log_file=log_file,
+            on_output=on_output,
+        )
+        self.jobs[job_id] = job
+        self._prune_jobs()
 
         # Persist on creation
         job_store.save_job(job_id, {
@@ -42,7 +270,6 @@ class JobManager:
             "log": [],
         })
 
-        import os
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
@@ -50,66 +277,186 @@ class JobManager:
             cwd=cwd,
             env=env,
             start_new_session=True,  # own process group for clean signal delivery
+            limit=STREAM_LIMIT,
         )
-        self.jobs[job_id]["process"] = process
+        _enlarge_stdout_pipe(process)
+        job.process = process
 
         async def _read_output():
+            # One decoder per stream keeps multi-byte characters that
+            # straddle a chunk boundary intact.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
             while True:
-                line = await process.stdout.readline()
-                if not line:
+                # StreamReader has no readinto(): the pipe transport already
+                # hands it fresh bytes from os.read(), so copying into a
+                # reused bytearray would add a copy rather than save one.
+                chunk = await process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
                     break
-                self.jobs[job_id]["log"].append(line.decode().rstrip())
+                _write_log_file(job, chunk)
+                *lines, job.partial = (
+                    job.partial + decoder.decode(chunk)
+                ).split("\n")
+                if lines:
+                    _extend_log(job, [line.rstrip() for line in lines])
+            tail = job.partial + decoder.decode(b"", final=True)
+            job.partial = ""
+            if tail:
+                _append_log(job, tail.rstrip())
 
             await process.wait()
             rc = process.returncode
-            self.jobs[job_id]["status"] = "completed" if rc == 0 else "failed"
-            self.jobs[job_id]["returncode"] = rc
+            job.status = (
+                JobStatusEnum.completed if rc == 0 else JobStatusEnum.failed
+            )
+            job.returncode = rc
+            _close_log_file(job)
+            _notify(job)
 
             # Persist on completion/failure
-            log_lines = self.jobs[job_id]["log"]
             job_store.save_job(job_id, {
                 "id": job_id,
-                "type": self.jobs[job_id].get("type", "unknown"),
-                "status": self.jobs[job_id]["status"],
+                "type": job.type,
+                "status": job.status,
                 "returncode": rc,
-                "log": log_lines[-200:],  # persist last 200 lines
+                "log": _log_tail(job.log, 200),
             })
 
-        asyncio.create_task(_read_output())
+        task = asyncio.create_task(_read_output())
+        job.reader_task = task
+        self._reader_tasks.add(task)
+        task.add_done_callback(self._reader_tasks.discard)
+        task.add_done_callback(lambda t: self._reader_done(job_id, t))
         return job_id
 
-    def get_job(self, job_id: str) -> dict:
-        """Return full job dict or a sentinel ``{"status": "not_found"}``."""
-        return self.jobs.get(job_id, {"status": "not_found"})
+    def _reader_done(self, job_id: str, task: asyncio.Task) -> None:
+        """Record a crashed output reader in the job log and fail the job.
 
-    def get_log(self, job_id: str, since: int = 0) -> list[str]:
-        """Return log lines starting from index *since*."""
+        The process group is killed as well: with nobody draining its
+        stdout it would block on a full pipe forever.
+        """
+        if task.cancelled() or task.exception() is None:
+            return
+        exc = task.exception()
+        logger.error("Log reader for job %s crashed", job_id, exc_info=exc)
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        proc = job.process
+        if proc is not None and proc.returncode is None:
+            self._schedule_kill(proc, 0)
+        _append_note(job, f"--- log reader crashed: {exc!r} ---")
+        job.status = JobStatusEnum.failed
+        _close_log_file(job)
+        _notify(job)
+        job_store.save_job(job_id, {
+            "id": job_id,
+            "type": job.type,
+            "status": "failed",
+            "returncode": job.returncode,
+            "log": _log_tail(job.log, 200),
+        })
+
+    def _new_job_id(self) -> str:
+        """Return a random 8-hex-digit job ID not used by a known job."""
+        while True:
+            job_id = secrets.token_hex(4)
+            if job_id not in self.jobs and job_store.load_job(job_id) is None:
+                return job_id
+
+    def _prune_jobs(self) -> None:
+        """Drop the least recently used finished jobs beyond ``MAX_JOBS``."""
+        excess = len(self.jobs) - MAX_JOBS
+        if excess <= 0:
+            return
+        stale = [
+            jid for jid, job in self.jobs.items()
+            if job.status != JobStatusEnum.running
+        ][:excess]
+        for jid in stale:
+            del self.jobs[jid]
+
+    def _lookup(self, job_id: str) -> Optional[Job]:
+        """Return the in-memory job or, if it was evicted, its persisted record.
+
+        Jobs rebuilt from ``JOBS_DIR`` are not re-inserted into ``self.jobs``.
+        """
         job = self.jobs.get(job_id)
+        if job is not None:
+            return job
+        try:
+            stored = job_store.load_job(job_id)
+        except (OSError, ValueError):
+            return None
+        return _job_from_record(stored) if stored else None
+
+    def _schedule_kill(
+        self, proc: asyncio.subprocess.Process, delay: float
+    ) -> None:
+        """Run :func:`_kill_after` for *proc*, keeping the task referenced."""
+        task = asyncio.create_task(_kill_after(proc, delay))
+        self._kill_tasks.add(task)
+        task.add_done_callback(self._kill_tasks.discard)
+
+    def get_job(self, job_id: str) -> Job:
+        """Return the job, or a placeholder whose status is ``not_found``."""
+        job = self._lookup(job_id)
+        if job is None:
+            return Job(status=JobStatusEnum.not_found)
+        if job_id in self.jobs:
+            self.jobs.move_to_end(job_id)
+        return job
+
+    def get_update_event(self, job_id: str) -> Optional[asyncio.Event]:
+        """Return an event that is set on the job's next log line or status change."""
+        job = self.jobs.get(job_id)
+        return job.updated if job else None
+
+    def get_log(self, job_id: str, since: int = 0) -> list[str]:
+        """Return log lines starting from absolute line index *since*.
+
+        Only the in-memory ring is served: lines that have already been
+        evicted are skipped, so a slow client resumes at the oldest line
+        still held.  The full output stays in the job's log file.
+        """
+        job = self._lookup(job_id)
+        if not job:
+            return []
+        start = max(0, since - job.log_start)
+        return list(itertools.islice(job.log, start, None))
+
+    def get_log_tail(self, job_id: str, n: int) -> list[str]:
+        """Return the last *n* in-memory log lines without copying the rest."""
+        job = self._lookup(job_id)
         if not job:
             return []
-        return job["log"][since:]
+        return _log_tail(job.log, n)
 
     async def cancel_job(self, job_id: str) -> bool:
-        """Send SIGTERM to a running process.  Returns True if signal was sent."""
+        """Send SIGTERM to a running process.  Returns True if signal was sent.
+
+        If the process group is still alive after ``CANCEL_GRACE_PERIOD``
+        seconds it is sent SIGKILL.
+        """
         job = self.jobs.get(job_id)
-        if not job or job["status"] != "running":
+        if not job or job.status != JobStatusEnum.running:
             return False
-        proc = job.get("process")
+        proc = job.process
         if proc and proc.returncode is None:
             # Kill the whole process group (bash + solver child)
-            import signal
             try:
                 os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
             except (ProcessLookupError, PermissionError, OSError):
                 proc.terminate()
-            job["status"] = "failed"
-            job["log"].append("--- job cancelled by user ---")
+            self._schedule_kill(proc, CANCEL_GRACE_PERIOD)
+            job.status = JobStatusEnum.failed
+            _append_note(job, "--- job cancelled by user ---")
             job_store.save_job(job_id, {
                 "id": job_id,
-                "type": job.get("type", "unknown"),
+                "type": job.type,
                 "status": "failed",
                 "returncode": -1,
-                "log": job["log"][-200:],
+                "log": _log_tail(job.log, 200),
             })
             return True
         return False
@@ -119,23 +466,16 @@ class JobManager:
 
         Running jobs cannot be resumed, so they are marked as failed.
         """
-        for stored in job_store.list_jobs():
+        # Oldest first, so the newest jobs survive pruning
+        for stored in reversed(job_store.list_jobs()):
             jid = stored.get("id")
             if not jid or jid in self.jobs:
                 continue
-            status = stored.get("status", "unknown")
-            if status == "running":
-                status = "failed"  # cannot resume
-                stored["status"] = status
+            if stored.get("status") == "running":
+                stored["status"] = "failed"  # cannot resume
                 job_store.save_job(jid, stored)
-            self.jobs[jid] = {
-                "status": status,
-                "cmd": stored.get("cmd", []),
-                "log": stored.get("log", []),
-                "process": None,
-                "returncode": stored.get("returncode"),
-                "type": stored.get("type", "unknown"),
-            }
+            self.jobs[jid] = _job_from_record(stored)
+        self._prune_jobs()
 
 
 # Module-level singleton so all route modules share the same instance.
@@ -3,20 +3,37 @@ import os
 import shutil
 
 
+def _is_executable(path: str) -> bool:
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
 def find_executable(name: str, env_var: str) -> str | None:
-    """Resolve executable: check env var, then shutil.which(), then /usr/local/bin/."""
+    """Resolve executable: check env var, then shutil.which(), then /usr/local/bin/.
+
+    Resolution happens once at import; route handlers test the resulting
+    module constants rather than touching the filesystem per request.
+    """
     path = os.environ.get(env_var)
-    if path and os.path.isfile(path):
+    if path and _is_executable(path):
         return path
     path = shutil.which(name)
     if path:
         return path
     fallback = f"/usr/local/bin/{name}"
-    if os.path.isfile(fallback):
+    if _is_executable(fallback):
         return fallback
     return None
 
 
+def _dir_from_env(env_var: str, default: str) -> str:
+    """Read a directory path from *env_var*, made absolute and normalised once.
+
+    Route handlers compare and join against these constants on every
+    request, so they can rely on them already being in canonical form.
+    """
+    return os.path.abspath(os.environ.get(env_var, default))
+
+
 # Module-level constants
 MESH_BIN = find_executable("fiberFoamMesh", "FIBERFOAM_MESH_BIN")
 PREDICT_BIN = find_executable("fiberFoamPredict", "FIBERFOAM_PREDICT_BIN")
@@ -24,17 +41,17 @@ SOLVER_BIN = find_executable("simpleFoamMod", "FIBERFOAM_SOLVER_BIN")
 RUN_BIN = find_executable("fiberFoamRun", "FIBERFOAM_RUN_BIN")
 POSTPROCESS_BIN = find_executable("fiberFoamPostProcess", "FIBERFOAM_POSTPROCESS_BIN")
 
-MODELS_DIR = os.environ.get("FIBERFOAM_MODELS_DIR", "/app/models")
+MODELS_DIR = _dir_from_env("FIBERFOAM_MODELS_DIR", "/app/models")
 SCALING_FACTORS = os.environ.get(
     "FIBERFOAM_SCALING_FACTORS", os.path.join(MODELS_DIR, "scaling_factors.json")
 )
-WORK_DIR = os.environ.get("FIBERFOAM_WORK_DIR", "/tmp/fiberfoam/cases")
-UPLOAD_DIR = os.environ.get("FIBERFOAM_UPLOAD_DIR", "/tmp/fiberfoam/uploads")
-BATCH_DIR = os.environ.get("FIBERFOAM_BATCH_DIR", "/data/input")
-JOBS_DIR = os.environ.get("FIBERFOAM_JOBS_DIR", "/data/jobs")
-OUTPUT_ROOT = os.environ.get("FIBERFOAM_OUTPUT_ROOT", WORK_DIR)
-HOST_ROOT = os.environ.get("FIBERFOAM_HOST_ROOT", "/host")
-FEEDBACK_DIR = os.environ.get("FIBERFOAM_FEEDBACK_DIR", "/data/feedback")
+WORK_DIR = _dir_from_env("FIBERFOAM_WORK_DIR", "/tmp/fiberfoam/cases")
+UPLOAD_DIR = _dir_from_env("FIBERFOAM_UPLOAD_DIR", "/tmp/fiberfoam/uploads")
+BATCH_DIR = _dir_from_env("FIBERFOAM_BATCH_DIR", "/data/input")
+JOBS_DIR = _dir_from_env("FIBERFOAM_JOBS_DIR", "/data/jobs")
+OUTPUT_ROOT = _dir_from_env("FIBERFOAM_OUTPUT_ROOT", WORK_DIR)
+HOST_ROOT = _dir_from_env("FIBERFOAM_HOST_ROOT", "/host")
+FEEDBACK_DIR = _dir_from_env("FIBERFOAM_FEEDBACK_DIR", "/data/feedback")
 
 # OpenFOAM bashrc path for sourcing before running the solver
 OPENFOAM_BASHRC = os.environ.get(